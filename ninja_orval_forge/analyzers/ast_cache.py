@@ -0,0 +1,113 @@
+"""
+ASTパースキャッシュ
+"""
+
+import ast
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(path_str: str, mtime_ns: int, size: int, optimize: int) -> ast.Module:
+    """ファイルを読み込んでASTを生成（キャッシュキー: パス + 更新時刻 + サイズ）"""
+    # bytesのまま渡すとパーサ内部での再エンコードを省ける
+    with open(path_str, 'rb') as f:
+        data = f.read()
+
+    return compile(data, path_str, 'exec', flags=ast.PyCF_ONLY_AST, optimize=optimize)
+
+
+def parse_python_file(file_path: Path, optimize: int = -1) -> ast.Module:
+    """ファイルのASTを取得（未変更ならキャッシュを再利用）
+
+    docstringを利用しない呼び出し側はoptimize=2を指定するとdocstringの
+    構築を省略できる。
+    """
+    st = file_path.stat()
+    return _parse_cached(str(file_path), st.st_mtime_ns, st.st_size, optimize)
+
+
+def iter_module_classes(tree: ast.Module) -> Iterator[ast.ClassDef]:
+    """モジュール直下のクラス定義を列挙
+
+    Django のモデルやSerializer/ViewSetはトップレベルに定義されるため、
+    ast.walkで全ノードを走査せず、モジュール直下（try/if配下の条件付き
+    定義を含む）のみをスキャンする。
+    """
+    nodes = list(tree.body)
+    for node in nodes:
+        if isinstance(node, ast.ClassDef):
+            yield node
+        elif isinstance(node, ast.Try):
+            nodes.extend(node.body)
+            nodes.extend(node.orelse)
+            for handler in node.handlers:
+                nodes.extend(handler.body)
+        elif isinstance(node, ast.If):
+            nodes.extend(node.body)
+            nodes.extend(node.orelse)
+
+
+def _attribute_name(node: ast.Attribute) -> Optional[Tuple[Optional[str], str]]:
+    if isinstance(node.value, ast.Name):
+        return (node.value.id, node.attr)
+    return None
+
+
+def _plain_name(node: ast.Name) -> Tuple[Optional[str], str]:
+    return (None, node.id)
+
+
+# isinstanceチェーンの代わりにノード型をキーにしたディスパッチテーブルを使う
+_NAME_HANDLERS = {
+    ast.Attribute: _attribute_name,
+    ast.Name: _plain_name,
+}
+
+
+def dotted_name_of(node: ast.expr) -> Optional[Tuple[Optional[str], str]]:
+    """`models.Model` / `Model` 形式のノードを (モジュール名, クラス名) に正規化"""
+    handler = _NAME_HANDLERS.get(type(node))
+    return handler(node) if handler else None
+
+
+def cheap_unparse(node: ast.expr) -> str:
+    """単純な形状のノードを直接文字列化（ast.unparseのビジター走査を回避）"""
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Attribute:
+        return f"{cheap_unparse(node.value)}.{node.attr}"
+    if node_type is ast.Constant:
+        return repr(node.value)
+
+    return ast.unparse(node)
+
+
+# 複合リテラルの評価結果キャッシュ（null=True等の定型オプションは頻出する）
+_LITERAL_CACHE: Dict[str, Any] = {}
+_LITERAL_CACHE_MAX = 1024
+
+
+def literal_value(node: ast.expr) -> Any:
+    """定数ノードをPython値へ評価（評価できない場合はソース文字列を返す）"""
+    # ast.Constantの即値はliteral_evalを経由せず直接取り出す
+    if type(node) is ast.Constant:
+        return node.value
+
+    key = ast.dump(node)
+    if key in _LITERAL_CACHE:
+        return _LITERAL_CACHE[key]
+
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError):
+        # 複雑な値の場合は文字列として保存
+        value = cheap_unparse(node)
+
+    if len(_LITERAL_CACHE) >= _LITERAL_CACHE_MAX:
+        _LITERAL_CACHE.clear()
+    _LITERAL_CACHE[key] = value
+
+    return value
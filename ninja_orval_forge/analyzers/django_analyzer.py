@@ -3,99 +3,200 @@ Django プロジェクト解析器
 """
 
 import ast
+import json
+import logging
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
+
+from .ast_cache import (
+    dotted_name_of,
+    iter_module_classes,
+    literal_value,
+    parse_python_file,
+)
+
+logger = logging.getLogger(__name__)
+
+# フィールドとして扱わない名前
+_SKIP_FIELDS = frozenset({'objects', 'DoesNotExist', 'Meta'})
+_SKIP_PREFIXES = ('_',)
 
 
 class DjangoAnalyzer:
     """Djangoプロジェクトとモデルを解析"""
-    
+
+    # モデル名→定義ファイルの索引の永続化先
+    INDEX_FILE = Path(".ninja_orval_forge") / "model_index.json"
+
     def __init__(self, project_path: Path):
         self.project_path = project_path
-        
+        self._app_dirs_cache: Optional[List[Path]] = None
+        self._model_index: Optional[Dict[str, Path]] = None
+
     def analyze_model(self, model_name: str) -> Dict[str, Any]:
         """指定されたモデルを解析"""
         model_info = self._find_model(model_name)
         if not model_info:
             raise ValueError(f"モデル '{model_name}' が見つかりません")
-            
+
         return model_info
-    
+
     def get_project_apps(self) -> List[str]:
         """プロジェクト内のDjangoアプリケーションを取得"""
-        apps = []
-        
-        for item in self.project_path.iterdir():
-            if item.is_dir() and self._is_django_app(item):
-                apps.append(item.name)
-                
-        return apps
-    
+        return [app_dir.name for app_dir in self._get_app_dirs()]
+
+    def _get_app_dirs(self) -> List[Path]:
+        """Djangoアプリのディレクトリ一覧を取得（初回スキャン結果をキャッシュ）"""
+        if self._app_dirs_cache is None:
+            app_dirs = []
+
+            # os.scandirはDirEntryに種別情報がキャッシュされるためiterdirより速い
+            # （シンボリックリンクのアプリも辿れるようリンクは追う）
+            with os.scandir(self.project_path) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+
+                    # 1回のlistdirでapps.py/models.py/modelsの有無をまとめて判定
+                    try:
+                        names = set(os.listdir(entry.path))
+                    except OSError:
+                        continue
+
+                    if (
+                        'apps.py' in names
+                        or 'models.py' in names
+                        or ('models' in names
+                            and os.path.isdir(os.path.join(entry.path, 'models')))
+                    ):
+                        app_dirs.append(Path(entry.path))
+
+            self._app_dirs_cache = app_dirs
+
+        return self._app_dirs_cache
+
     def _find_model(self, model_name: str) -> Optional[Dict[str, Any]]:
         """モデルを検索"""
-        for app_dir in self.project_path.iterdir():
-            if not app_dir.is_dir() or not self._is_django_app(app_dir):
-                continue
-                
+        if self._model_index is None:
+            self._model_index = self._build_model_index()
+
+        models_file = self._model_index.get(model_name)
+        if models_file is None or not models_file.exists():
+            return None
+
+        return self._parse_models_file(models_file, model_name)
+
+    def _iter_models_files(self) -> Iterator[Path]:
+        """全アプリのモデル定義ファイルを列挙"""
+        for app_dir in self._get_app_dirs():
             models_file = app_dir / "models.py"
             if models_file.exists():
-                model_info = self._parse_models_file(models_file, model_name)
-                if model_info:
-                    return model_info
-                    
+                yield models_file
+
             # models/ディレクトリの場合
             models_dir = app_dir / "models"
             if models_dir.is_dir():
                 for model_file in models_dir.glob("*.py"):
-                    if model_file.name == "__init__.py":
-                        continue
-                    model_info = self._parse_models_file(model_file, model_name)
-                    if model_info:
-                        return model_info
-        
-        return None
-    
-    def _is_django_app(self, path: Path) -> bool:
-        """Djangoアプリケーションかどうかを判定"""
-        # apps.pyまたはmodels.pyが存在するかチェック
-        return (
-            (path / "apps.py").exists() or
-            (path / "models.py").exists() or
-            (path / "models").is_dir()
-        )
+                    if model_file.name != "__init__.py":
+                        yield model_file
+
+    def _build_model_index(self) -> Dict[str, Path]:
+        """モデル名→定義ファイルの索引を構築
+
+        索引はJSONとして永続化し、mtimeが一致するファイルは再パースしない。
+        """
+        index_path = self.project_path / self.INDEX_FILE
+
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                cached_files = json.load(f).get('files', {})
+        except (OSError, ValueError):
+            cached_files = {}
+
+        files = {}
+        stale_files = []
+        for models_file in self._iter_models_files():
+            path_str = str(models_file)
+            mtime_ns = models_file.stat().st_mtime_ns
+
+            entry = cached_files.get(path_str)
+            if entry and entry.get('mtime_ns') == mtime_ns:
+                files[path_str] = entry
+            else:
+                files[path_str] = {'mtime_ns': mtime_ns, 'models': []}
+                stale_files.append(models_file)
+
+        # 再パースが必要なファイルはスレッドプールでI/Oとパースを重ねる
+        if len(stale_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(stale_files))) as executor:
+                model_lists = list(executor.map(self._list_model_classes, stale_files))
+        else:
+            model_lists = [self._list_model_classes(f) for f in stale_files]
+
+        for models_file, models in zip(stale_files, model_lists):
+            files[str(models_file)]['models'] = models
+
+        if files != cached_files:
+            try:
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(index_path, 'w', encoding='utf-8') as f:
+                    json.dump({'files': files}, f, ensure_ascii=False)
+            except OSError:
+                pass
+
+        index: Dict[str, Path] = {}
+        for path_str, entry in files.items():
+            for name in entry['models']:
+                index.setdefault(name, Path(path_str))
+
+        return index
+
+    def _list_model_classes(self, file_path: Path) -> List[str]:
+        """ファイル内のトップレベルのDjangoモデルクラス名を列挙"""
+        try:
+            if b"class " not in file_path.read_bytes():
+                return []
+
+            tree = parse_python_file(file_path)
+        except (OSError, SyntaxError):
+            return []
+
+        return [
+            node.name
+            for node in iter_module_classes(tree)
+            if self._is_model_class(node)
+        ]
     
     def _parse_models_file(self, file_path: Path, target_model: str) -> Optional[Dict[str, Any]]:
         """models.pyファイルを解析"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content)
-            
-            for node in ast.walk(tree):
-                if (isinstance(node, ast.ClassDef) and 
-                    node.name == target_model and
+            # バイト列の部分一致で事前フィルタし、無関係なファイルのパースを省く
+            data = file_path.read_bytes()
+            if b"class " not in data or target_model.encode('utf-8') not in data:
+                return None
+
+            tree = parse_python_file(file_path)
+
+            for node in iter_module_classes(tree):
+                if (node.name == target_model and
                     self._is_model_class(node)):
                     
                     return self._extract_model_info(node, file_path)
                     
         except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
+            logger.warning("Error parsing %s: %s", file_path, e)
             
         return None
     
     def _is_model_class(self, class_node: ast.ClassDef) -> bool:
         """Django Modelクラスかどうかを判定"""
         for base in class_node.bases:
-            if isinstance(base, ast.Attribute):
-                if (isinstance(base.value, ast.Name) and 
-                    base.value.id == 'models' and 
-                    base.attr == 'Model'):
-                    return True
-            elif isinstance(base, ast.Name) and base.id == 'Model':
+            if dotted_name_of(base) in (('models', 'Model'), (None, 'Model')):
                 return True
-                
+
         return False
     
     def _extract_model_info(self, class_node: ast.ClassDef, file_path: Path) -> Dict[str, Any]:
@@ -132,48 +233,32 @@ class DjangoAnalyzer:
             return None
             
         field_name = target.id
-        
+
         # 特殊フィールドをスキップ
-        if field_name.startswith('_') or field_name in ['objects', 'DoesNotExist']:
+        if field_name in _SKIP_FIELDS or field_name.startswith(_SKIP_PREFIXES):
             return None
-        
-        field_type = self._extract_field_type(assign_node.value)
-        if not field_type:
+
+        # フィールド型とオプションを1回のノード分解でまとめて抽出する
+        value_node = assign_node.value
+        if type(value_node) is not ast.Call:
             return None
-            
-        field_options = self._extract_field_options(assign_node.value)
-        
-        return {
+
+        named = dotted_name_of(value_node.func)
+        if named is None or named[0] != 'models':
+            return None
+
+        field_info = {
             'name': field_name,
-            'type': field_type,
-            **field_options
+            # フィールド型名はマッピング参照で繰り返し使うためintern
+            'type': sys.intern(named[1]),
         }
-    
-    def _extract_field_type(self, value_node: ast.AST) -> Optional[str]:
-        """フィールドタイプを抽出"""
-        if isinstance(value_node, ast.Call):
-            if isinstance(value_node.func, ast.Attribute):
-                if (isinstance(value_node.func.value, ast.Name) and 
-                    value_node.func.value.id == 'models'):
-                    return value_node.func.attr
-                    
-        return None
-    
-    def _extract_field_options(self, value_node: ast.AST) -> Dict[str, Any]:
-        """フィールドオプションを抽出"""
-        options = {}
-        
-        if isinstance(value_node, ast.Call):
-            # キーワード引数の解析
-            for keyword in value_node.keywords:
-                if keyword.arg:
-                    try:
-                        options[keyword.arg] = ast.literal_eval(keyword.value)
-                    except (ValueError, TypeError):
-                        # 複雑な値の場合は文字列として保存
-                        options[keyword.arg] = ast.unparse(keyword.value)
-                        
-        return options
+
+        # キーワード引数の解析
+        for keyword in value_node.keywords:
+            if keyword.arg:
+                field_info[keyword.arg] = literal_value(keyword.value)
+
+        return field_info
     
     def _extract_meta_info(self, meta_node: ast.ClassDef) -> Dict[str, Any]:
         """Metaクラス情報を抽出"""
@@ -183,11 +268,8 @@ class DjangoAnalyzer:
             if isinstance(node, ast.Assign):
                 for target in node.targets:
                     if isinstance(target, ast.Name):
-                        try:
-                            meta[target.id] = ast.literal_eval(node.value)
-                        except (ValueError, TypeError):
-                            meta[target.id] = ast.unparse(node.value)
-                            
+                        meta[target.id] = literal_value(node.value)
+
         return meta
     
     def _extract_docstring(self, class_node: ast.ClassDef) -> str:
@@ -3,8 +3,20 @@ Django REST Framework 解析器
 """
 
 import ast
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from .ast_cache import (
+    cheap_unparse,
+    dotted_name_of,
+    iter_module_classes,
+    literal_value,
+    parse_python_file,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class DRFAnalyzer:
@@ -13,6 +25,9 @@ class DRFAnalyzer:
     def __init__(self, app_path: Path):
         self.app_path = app_path
         
+    # Serializer/ViewSetの定義が置かれうるファイル
+    TARGET_FILES = ("serializers.py", "views.py", "api.py")
+
     def analyze_app(self) -> Dict[str, Any]:
         """アプリケーション全体のDRFコードを解析"""
         result = {
@@ -20,89 +35,83 @@ class DRFAnalyzer:
             'viewsets': [],
             'issues': []
         }
-        
-        # Serializerの解析
-        serializers_file = self.app_path / "serializers.py"
-        if serializers_file.exists():
-            serializers = self._analyze_serializers(serializers_file)
+
+        target_files = [
+            self.app_path / file_name
+            for file_name in self.TARGET_FILES
+            if (self.app_path / file_name).exists()
+        ]
+
+        # 各ファイルを1回のパース・走査でSerializerとViewSetの両方を抽出
+        # 複数ファイルある場合はスレッドプールでI/Oとパースを重ねる
+        if len(target_files) > 1:
+            with ThreadPoolExecutor(max_workers=len(target_files)) as executor:
+                analyzed = list(executor.map(self._analyze_file, target_files))
+        else:
+            analyzed = [self._analyze_file(f) for f in target_files]
+
+        for serializers, viewsets in analyzed:
             result['serializers'].extend(serializers)
-        
-        # ViewSetの解析
-        views_file = self.app_path / "views.py"
-        if views_file.exists():
-            viewsets = self._analyze_viewsets(views_file)
             result['viewsets'].extend(viewsets)
-            
+
         return result
-    
-    def _analyze_serializers(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Serializerファイルを解析"""
+
+    def _analyze_file(self, file_path: Path) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """1ファイルを解析してSerializerとViewSetを抽出"""
         serializers = []
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content)
-            
-            for node in ast.walk(tree):
-                if (isinstance(node, ast.ClassDef) and 
-                    self._is_serializer_class(node)):
-                    
-                    serializer_info = self._extract_serializer_info(node, file_path)
-                    serializers.append(serializer_info)
-                    
-        except Exception as e:
-            print(f"Error analyzing serializers in {file_path}: {e}")
-            
-        return serializers
-    
-    def _analyze_viewsets(self, file_path: Path) -> List[Dict[str, Any]]:
-        """ViewSetファイルを解析"""
         viewsets = []
-        
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content)
-            
-            for node in ast.walk(tree):
-                if (isinstance(node, ast.ClassDef) and 
-                    self._is_viewset_class(node)):
-                    
-                    viewset_info = self._extract_viewset_info(node, file_path)
-                    viewsets.append(viewset_info)
-                    
+            # Serializer/ViewSetのどちらも現れないファイルはパースせずスキップ
+            data = file_path.read_bytes()
+            if b"Serializer" not in data and b"ViewSet" not in data:
+                return serializers, viewsets
+
+            # docstringは抽出しないためoptimize=2でパースコストを下げる
+            tree = parse_python_file(file_path, optimize=2)
+
+            for node in iter_module_classes(tree):
+                # 基底クラス名は1回だけ正規化し、両方の判定で共有する
+                bases = self._class_base_names(node)
+
+                if self._is_serializer_class(bases):
+                    serializers.append(self._extract_serializer_info(node, file_path))
+                elif self._is_viewset_class(bases):
+                    viewsets.append(self._extract_viewset_info(node, file_path))
+
         except Exception as e:
-            print(f"Error analyzing viewsets in {file_path}: {e}")
-            
-        return viewsets
-    
-    def _is_serializer_class(self, class_node: ast.ClassDef) -> bool:
-        """Serializerクラスかどうかを判定"""
+            logger.warning("Error analyzing %s: %s", file_path, e)
+
+        return serializers, viewsets
+
+    def _class_base_names(self, class_node: ast.ClassDef) -> List[Tuple[Optional[str], str]]:
+        """基底クラスを (モジュール名, クラス名) のペアに正規化"""
+        bases = []
         for base in class_node.bases:
-            if isinstance(base, ast.Attribute):
-                if (isinstance(base.value, ast.Name) and 
-                    base.value.id == 'serializers' and 
-                    'Serializer' in base.attr):
-                    return True
-            elif isinstance(base, ast.Name) and 'Serializer' in base.id:
+            named = dotted_name_of(base)
+            if named is not None:
+                bases.append(named)
+
+        return bases
+
+    def _is_serializer_class(self, bases: List[Tuple[Optional[str], str]]) -> bool:
+        """Serializerクラスかどうかを判定"""
+        for module, name in bases:
+            if module == 'serializers' and 'Serializer' in name:
                 return True
-                
+            elif module is None and 'Serializer' in name:
+                return True
+
         return False
-    
-    def _is_viewset_class(self, class_node: ast.ClassDef) -> bool:
+
+    def _is_viewset_class(self, bases: List[Tuple[Optional[str], str]]) -> bool:
         """ViewSetクラスかどうかを判定"""
-        for base in class_node.bases:
-            if isinstance(base, ast.Attribute):
-                if (isinstance(base.value, ast.Name) and 
-                    base.value.id == 'viewsets' and 
-                    'ViewSet' in base.attr):
-                    return True
-            elif isinstance(base, ast.Name) and 'ViewSet' in base.id:
+        for module, name in bases:
+            if module == 'viewsets' and 'ViewSet' in name:
                 return True
-                
+            elif module is None and 'ViewSet' in name:
+                return True
+
         return False
     
     def _extract_serializer_info(self, class_node: ast.ClassDef, file_path: Path) -> Dict[str, Any]:
@@ -129,6 +138,8 @@ class DRFAnalyzer:
             'model': model,
             'fields': fields,
             'meta': meta_info,
+            # 変換側がファイルを再パースしなくて済むよう解析済みノードを添付
+            'ast_node': class_node,
         }
     
     def _extract_viewset_info(self, class_node: ast.ClassDef, file_path: Path) -> Dict[str, Any]:
@@ -142,9 +153,9 @@ class DRFAnalyzer:
                 for target in node.targets:
                     if isinstance(target, ast.Name):
                         if target.id == 'queryset':
-                            queryset = ast.unparse(node.value)
+                            queryset = cheap_unparse(node.value)
                         elif target.id == 'serializer_class':
-                            serializer_class = ast.unparse(node.value)
+                            serializer_class = cheap_unparse(node.value)
                             
             elif isinstance(node, ast.FunctionDef):
                 # カスタムアクションの検出
@@ -161,6 +172,8 @@ class DRFAnalyzer:
             'queryset': queryset,
             'serializer_class': serializer_class,
             'actions': list(set(actions)),  # 重複除去
+            # 変換側がファイルを再パースしなくて済むよう解析済みノードを添付
+            'ast_node': class_node,
         }
     
     def _extract_serializer_field(self, assign_node: ast.Assign) -> Optional[Dict[str, Any]]:
@@ -196,11 +209,8 @@ class DRFAnalyzer:
             if isinstance(node, ast.Assign):
                 for target in node.targets:
                     if isinstance(target, ast.Name):
-                        try:
-                            meta[target.id] = ast.literal_eval(node.value)
-                        except (ValueError, TypeError):
-                            meta[target.id] = ast.unparse(node.value)
-                            
+                        meta[target.id] = literal_value(node.value)
+
         return meta
     
     def _has_action_decorator(self, func_node: ast.FunctionDef) -> bool:
@@ -2,53 +2,76 @@
 ninja-orval-forge CLIメインモジュール
 """
 
+import importlib
+import logging
 import sys
-from pathlib import Path
-from typing import Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
 from . import __version__
-from .commands.init import init_command
-from .commands.generate import generate_command
-from .commands.migrate import migrate_command
 
-console = Console()
+# サブコマンド名 → (実装モジュール, コマンドオブジェクト名)
+# 呼び出されたコマンドのモジュールだけを実行時にimportし、起動を速くする
+LAZY_SUBCOMMANDS = {
+    "init": ("ninja_orval_forge.commands.init", "init_command"),
+    "generate": ("ninja_orval_forge.commands.generate", "generate_command"),
+    "migrate": ("ninja_orval_forge.commands.migrate", "migrate_command"),
+}
+
+
+class LazyGroup(click.Group):
+    """サブコマンドを遅延importするclick.Group"""
+
+    def list_commands(self, ctx: click.Context):
+        return sorted(LAZY_SUBCOMMANDS)
+
+    def get_command(self, ctx: click.Context, name: str):
+        lazy = LAZY_SUBCOMMANDS.get(name)
+        if lazy is None:
+            return None
+
+        module_name, attr_name = lazy
+        return getattr(importlib.import_module(module_name), attr_name)
+
 
 def print_banner():
     """CLIバナーを表示"""
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.text import Text
+
     banner_text = Text("ninja-orval-forge", style="bold blue")
     subtitle = Text(f"v{__version__} - Django Ninja + Orval統合環境構築ツール", style="dim")
-    
+
     panel = Panel(
         Text.assemble(banner_text, "\n", subtitle),
         expand=False,
         border_style="blue",
         padding=(1, 2)
     )
-    console.print(panel)
+    Console().print(panel)
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.version_option(version=__version__, prog_name="ninja-orval-forge")
 @click.option(
-    "--verbose", "-v", 
-    is_flag=True, 
+    "--verbose", "-v",
+    is_flag=True,
     help="詳細な出力を表示"
 )
 @click.pass_context
 def cli(ctx: click.Context, verbose: bool):
     """
     Django Ninja + Orval統合環境構築ツール
-    
+
     DRFからDjango Ninjaへの移行とフルスタック型安全開発を支援します。
     """
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
-    
+
     if ctx.invoked_subcommand is None:
+        from rich.console import Console
+
+        console = Console()
         print_banner()
         console.print("\n[bold green]使用可能なコマンド:[/bold green]")
         console.print("  [cyan]init[/cyan]     - プロジェクトの初期化")
@@ -56,21 +79,22 @@ def cli(ctx: click.Context, verbose: bool):
         console.print("  [cyan]migrate[/cyan]  - DRFからの移行")
         console.print("\nヘルプ: [dim]ninja-orval-forge --help[/dim]")
 
-# サブコマンドの登録
-cli.add_command(init_command, name="init")
-cli.add_command(generate_command, name="generate")
-cli.add_command(migrate_command, name="migrate")
-
 def main():
     """エントリーポイント"""
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n[yellow]処理を中断しました。[/yellow]")
+        from rich.console import Console
+
+        Console().print("\n[yellow]処理を中断しました。[/yellow]")
         sys.exit(1)
     except Exception as e:
-        console.print(f"\n[red]エラーが発生しました: {str(e)}[/red]")
+        from rich.console import Console
+
+        Console().print(f"\n[red]エラーが発生しました: {str(e)}[/red]")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
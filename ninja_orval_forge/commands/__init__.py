@@ -1,7 +1,4 @@
-"""コマンドモジュール"""
+"""コマンドモジュール
 
-from .init import init_command
-from .generate import generate_command  
-from .migrate import migrate_command
-
-__all__ = ["init_command", "generate_command", "migrate_command"]
\ No newline at end of file
+各コマンドはcli.LazyGroupが実行時に遅延importするため、ここでは再エクスポートしない。
+"""
@@ -2,19 +2,32 @@
 API生成コマンド実装
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 import click
-import questionary
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..utils.file_manager import FileManager
 from ..generators.api_generator import APIGenerator
 from ..analyzers.django_analyzer import DjangoAnalyzer
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _console():
+    """Consoleの遅延シングルトン（rich importを実行時まで遅らせる）"""
+    from rich.console import Console
+
+    return Console()
+
+# 対話モードで提示するAPI操作の選択肢（毎回再構築しない）
+_OPERATION_CHOICES = (
+    {"name": "📋 一覧取得 (list)", "value": "list", "checked": True},
+    {"name": "🔍 詳細取得 (retrieve)", "value": "retrieve", "checked": True},
+    {"name": "➕ 作成 (create)", "value": "create", "checked": True},
+    {"name": "✏️ 更新 (update)", "value": "update", "checked": True},
+    {"name": "🗑️ 削除 (delete)", "value": "delete", "checked": False},
+)
 
 @click.command()
 @click.argument("feature_name")
@@ -56,17 +69,17 @@ def generate_command(
     
     current_dir = Path.cwd()
     
-    console.print(f"\n[bold green]API機能生成: {feature_name}[/bold green]")
-    console.print(f"対象モデル: [cyan]{model}[/cyan]")
+    _console().print(f"\n[bold green]API機能生成: {feature_name}[/bold green]")
+    _console().print(f"対象モデル: [cyan]{model}[/cyan]")
     
     # Djangoプロジェクトの分析
     analyzer = DjangoAnalyzer(current_dir)
     
     try:
         model_info = analyzer.analyze_model(model)
-        console.print(f"✅ モデル '{model}' を発見しました")
+        _console().print(f"✅ モデル '{model}' を発見しました")
     except Exception as e:
-        console.print(f"[red]❌ エラー: {str(e)}[/red]")
+        _console().print(f"[red]❌ エラー: {str(e)}[/red]")
         return
     
     # 操作の選択
@@ -78,7 +91,7 @@ def generate_command(
     # 設定の確認
     config = _load_project_config(current_dir)
     if not config:
-        console.print("[red]❌ プロジェクトが初期化されていません。先にninja-orval-forge initを実行してください。[/red]")
+        _console().print("[red]❌ プロジェクトが初期化されていません。先にninja-orval-forge initを実行してください。[/red]")
         return
     
     # 生成処理の実行
@@ -91,39 +104,29 @@ def generate_command(
         force
     )
     
-    console.print(f"\n[bold green]✅ API機能 '{feature_name}' の生成が完了しました！[/bold green]")
+    _console().print(f"\n[bold green]✅ API機能 '{feature_name}' の生成が完了しました！[/bold green]")
     _show_generated_files(current_dir, feature_name, config)
 
 def _select_operations() -> tuple:
     """操作を対話的に選択"""
+    import questionary
+
     operations = questionary.checkbox(
         "生成するAPI操作を選択してください:",
-        choices=[
-            {"name": "📋 一覧取得 (list)", "value": "list", "checked": True},
-            {"name": "🔍 詳細取得 (retrieve)", "value": "retrieve", "checked": True},
-            {"name": "➕ 作成 (create)", "value": "create", "checked": True},
-            {"name": "✏️ 更新 (update)", "value": "update", "checked": True},
-            {"name": "🗑️ 削除 (delete)", "value": "delete", "checked": False},
-        ]
+        choices=list(_OPERATION_CHOICES)
     ).ask()
     
     if not operations:
-        console.print("[yellow]⚠️ 操作が選択されませんでした。デフォルトでCRUD操作を生成します。[/yellow]")
+        _console().print("[yellow]⚠️ 操作が選択されませんでした。デフォルトでCRUD操作を生成します。[/yellow]")
         operations = ["list", "retrieve", "create", "update"]
     
     return tuple(operations)
 
 def _load_project_config(project_dir: Path):
     """プロジェクト設定を読み込み"""
-    from ..config import get_config_path
-    import yaml
-    
-    config_path = get_config_path(project_dir)
-    if not config_path.exists():
-        return None
-    
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    from ..config import get_config_path, load_config_cached
+
+    return load_config_cached(get_config_path(project_dir))
 
 def _generate_api_feature(
     project_dir: Path,
@@ -134,7 +137,8 @@ def _generate_api_feature(
     force: bool
 ):
     """API機能を生成"""
-    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     generator = APIGenerator()
     file_manager = FileManager()
     
@@ -144,45 +148,39 @@ def _generate_api_feature(
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=_console(),
     ) as progress:
         
         # ディレクトリ作成
         task1 = progress.add_task("ディレクトリを作成中...", total=None)
         feature_dir.mkdir(parents=True, exist_ok=True)
-        (feature_dir / "__init__.py").write_text("", encoding="utf-8")
+        # 空ファイルの作成はtouchの方がopen/encode/writeの往復より安い
+        (feature_dir / "__init__.py").touch(exist_ok=True)
         progress.update(task1, completed=100)
         
-        # スキーマファイル生成
+        # スキーマとビューは共有コンテキストから一括で描画する
         task2 = progress.add_task("Pydanticスキーマを生成中...", total=None)
-        schema_content = generator.generate_schema(
+        rendered = generator.generate_feature(
             feature_name, model_info, operations, config
         )
-        schema_path = feature_dir / "schema.py"
-        
-        if schema_path.exists() and not force:
-            if not questionary.confirm(f"'{schema_path}' が既に存在します。上書きしますか？").ask():
-                console.print("[yellow]スキーマファイルの生成をスキップしました。[/yellow]")
-            else:
-                file_manager.write_file(schema_path, schema_content)
-        else:
-            file_manager.write_file(schema_path, schema_content)
+        _write_generated_file(
+            file_manager,
+            feature_dir / "schema.py",
+            rendered["schema.py"],
+            "スキーマファイル",
+            force,
+        )
         progress.update(task2, completed=100)
-        
+
         # ビューファイル生成
         task3 = progress.add_task("Django Ninjaビューを生成中...", total=None)
-        views_content = generator.generate_views(
-            feature_name, model_info, operations, config
+        _write_generated_file(
+            file_manager,
+            feature_dir / "views.py",
+            rendered["views.py"],
+            "ビューファイル",
+            force,
         )
-        views_path = feature_dir / "views.py"
-        
-        if views_path.exists() and not force:
-            if not questionary.confirm(f"'{views_path}' が既に存在します。上書きしますか？").ask():
-                console.print("[yellow]ビューファイルの生成をスキップしました。[/yellow]")
-            else:
-                file_manager.write_file(views_path, views_content)
-        else:
-            file_manager.write_file(views_path, views_content)
         progress.update(task3, completed=100)
         
         # メインAPIファイルの更新
@@ -190,10 +188,33 @@ def _generate_api_feature(
         _update_main_api_file(project_dir, feature_name, config, force)
         progress.update(task4, completed=100)
 
+def _write_generated_file(
+    file_manager: FileManager,
+    file_path: Path,
+    content: str,
+    label: str,
+    force: bool
+):
+    """生成された内容をファイルに書き込み
+
+    既存ファイルと内容が同一なら上書き確認もスキップする。
+    """
+    if file_path.exists() and not force:
+        if file_manager.read_file(file_path) == content:
+            return
+
+        import questionary
+
+        if not questionary.confirm(f"'{file_path}' が既に存在します。上書きしますか？").ask():
+            _console().print(f"[yellow]{label}の生成をスキップしました。[/yellow]")
+            return
+
+    file_manager.write_if_changed(file_path, content)
+
 def _update_main_api_file(
-    project_dir: Path, 
-    feature_name: str, 
-    config: dict, 
+    project_dir: Path,
+    feature_name: str,
+    config: dict,
     force: bool
 ):
     """メインのapi.pyファイルにルーターを追加"""
@@ -202,55 +223,65 @@ def _update_main_api_file(
     api_file = project_dir / app_name / "apis" / "ninja" / "api.py"
     
     if not api_file.exists():
-        console.print(f"[yellow]⚠️ {api_file} が見つかりません。手動でルーターを追加してください。[/yellow]")
+        _console().print(f"[yellow]⚠️ {api_file} が見つかりません。手動でルーターを追加してください。[/yellow]")
         return
     
     content = api_file.read_text(encoding="utf-8")
-    
-    # インポート文の追加
+
+    # 分割は1回だけ行い、行リスト上で編集してから1回だけ結合する
+    lines = content.split("\n")
+    line_set = set(lines)
+
     import_line = f"from {app_name}.apis.ninja.api_views.{feature_name}.views import router as {feature_name}_router"
-    if import_line not in content:
-        # インポートセクションに追加
-        lines = content.split("\n")
-        insert_index = 0
-        for i, line in enumerate(lines):
+    router_line = f'api.add_router("", {feature_name}_router)'
+
+    need_import = import_line not in line_set
+    need_router = router_line not in line_set
+
+    if not need_import and not need_router:
+        return
+
+    # 1回の走査でインポートとルーター両方の挿入位置を決定
+    import_index = 0
+    router_index = None
+    in_import_section = True
+    for i, line in enumerate(lines):
+        if in_import_section:
             if line.startswith("from") and "import router as" in line:
-                insert_index = i + 1
+                import_index = i + 1
             elif line.startswith("api = NinjaAPI"):
-                break
-        
-        lines.insert(insert_index, import_line)
-        content = "\n".join(lines)
-    
-    # ルーター追加
-    router_line = f'api.add_router("", {feature_name}_router)'
-    if router_line not in content:
-        # api.add_router行の後に追加
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if "api.add_router(" in line:
-                lines.insert(i + 1, router_line)
-                break
-        else:
-            # 見つからない場合は最後に追加
-            lines.append("")
-            lines.append(router_line)
-        
-        content = "\n".join(lines)
-    
-    api_file.write_text(content, encoding="utf-8")
+                in_import_section = False
+        if router_index is None and "api.add_router(" in line:
+            router_index = i + 1
+
+    # 後ろの位置から挿入してインデックスのずれを防ぐ
+    insertions = []
+    if need_import:
+        insertions.append((import_index, import_line))
+    if need_router and router_index is not None:
+        insertions.append((router_index, router_line))
+
+    for index, line in sorted(insertions, reverse=True):
+        lines.insert(index, line)
+
+    if need_router and router_index is None:
+        # api.add_router行が見つからない場合は最後に追加
+        lines.append("")
+        lines.append(router_line)
+
+    api_file.write_text("\n".join(lines), encoding="utf-8")
 
 def _show_generated_files(project_dir: Path, feature_name: str, config: dict):
     """生成されたファイルを表示"""
     app_name = config["project"]["django_app"]
     base_path = f"{app_name}/apis/ninja/api_views/{feature_name}"
     
-    console.print(f"\n[bold blue]📁 生成されたファイル:[/bold blue]")
-    console.print(f"  [cyan]{base_path}/schema.py[/cyan] - Pydanticスキーマ")
-    console.print(f"  [cyan]{base_path}/views.py[/cyan] - Django Ninjaビュー")
-    console.print(f"  [cyan]{app_name}/apis/ninja/api.py[/cyan] - ルーター登録 (更新)")
+    _console().print(f"\n[bold blue]📁 生成されたファイル:[/bold blue]")
+    _console().print(f"  [cyan]{base_path}/schema.py[/cyan] - Pydanticスキーマ")
+    _console().print(f"  [cyan]{base_path}/views.py[/cyan] - Django Ninjaビュー")
+    _console().print(f"  [cyan]{app_name}/apis/ninja/api.py[/cyan] - ルーター登録 (更新)")
     
-    console.print(f"\n[bold blue]🔄 次のステップ:[/bold blue]")
-    console.print("1. Django開発サーバーを起動")
-    console.print("2. http://localhost:8000/ninja_api/docs でSwagger UIを確認")
-    console.print("3. [cyan]npm run ninja:generate[/cyan] でTypeScriptクライアントを生成")
\ No newline at end of file
+    _console().print(f"\n[bold blue]🔄 次のステップ:[/bold blue]")
+    _console().print("1. Django開発サーバーを起動")
+    _console().print("2. http://localhost:8000/ninja_api/docs でSwagger UIを確認")
+    _console().print("3. [cyan]npm run ninja:generate[/cyan] でTypeScriptクライアントを生成")
\ No newline at end of file
@@ -3,20 +3,24 @@
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 import click
-import questionary
-import yaml
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ..config import DEFAULT_CONFIG, SUPPORTED_FRAMEWORKS, get_config_path
+from ..config import SUPPORTED_FRAMEWORKS, get_config_path, new_default_config
 from ..utils.file_manager import FileManager
 from ..generators.api_generator import APIGenerator
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _console():
+    """Consoleの遅延シングルトン（rich importを実行時まで遅らせる）"""
+    from rich.console import Console
+
+    return Console()
 
 
 @click.command()
@@ -54,24 +58,28 @@ def init_command(
 
     # 既存設定の確認
     if config_path.exists() and not force:
+        import questionary
+
         if not questionary.confirm(
             "既存の設定ファイルが見つかりました。上書きしますか？"
         ).ask():
-            console.print("[yellow]初期化をキャンセルしました。[/yellow]")
+            _console().print("[yellow]初期化をキャンセルしました。[/yellow]")
             return
 
-    console.print(f"\n[bold green]ninja-orval-forge プロジェクト初期化[/bold green]")
-    console.print(f"プロジェクト: [cyan]{name}[/cyan]")
-    console.print(f"ディレクトリ: [dim]{current_dir}[/dim]\n")
+    _console().print(f"\n[bold green]ninja-orval-forge プロジェクト初期化[/bold green]")
+    _console().print(f"プロジェクト: [cyan]{name}[/cyan]")
+    _console().print(f"ディレクトリ: [dim]{current_dir}[/dim]\n")
 
     # 設定の収集
     config = _collect_configuration(name, app, frontend, interactive)
 
     # プロジェクト初期化の実行
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=_console(),
     ) as progress:
 
         task1 = progress.add_task("設定ファイルを作成中...", total=None)
@@ -91,7 +99,7 @@ def init_command(
             _setup_frontend(current_dir, config)
             progress.update(task4, completed=100)
 
-    console.print("\n[bold green]✅ プロジェクトの初期化が完了しました！[/bold green]")
+    _console().print("\n[bold green]✅ プロジェクトの初期化が完了しました！[/bold green]")
 
     # 次のステップの案内
     _show_next_steps(config)
@@ -102,11 +110,13 @@ def _collect_configuration(
 ) -> Dict[str, Any]:
     """設定情報を収集"""
 
-    config = DEFAULT_CONFIG.copy()
+    config = new_default_config()
     config["project"]["name"] = name
     config["project"]["django_app"] = app
 
     if interactive:
+        import questionary
+
         # フロントエンドフレームワークの選択
         if not frontend:
             frontend = questionary.select(
@@ -121,20 +131,35 @@ def _collect_configuration(
 
         config["frontend"]["framework"] = frontend
 
+        # 残りの質問は1つのformにまとめ、プロンプトの初期化回数を減らす
+        questions = {}
         if frontend != "none":
             # TypeScript設定
-            use_typescript = questionary.confirm(
+            questions["typescript"] = questionary.confirm(
                 "TypeScriptを使用しますか？ (推奨)", default=True
-            ).ask()
-            config["frontend"]["typescript"] = use_typescript
-
+            )
         # 認証設定
-        use_auth = questionary.confirm(
+        questions["auth_enabled"] = questionary.confirm(
             "認証機能を有効にしますか？", default=False
-        ).ask()
-        config["ninja"]["auth_enabled"] = use_auth
+        )
+        # レスポンス形式
+        questions["camel_case"] = questionary.confirm(
+            "レスポンスをキャメルケースにしますか？ (推奨)", default=True
+        )
+
+        answers = questionary.form(**questions).ask()
+
+        # Ctrl-Cで中断するとFormは空dictを返すため、キャンセルとして扱う
+        if not answers:
+            raise KeyboardInterrupt
+
+        if frontend != "none":
+            config["frontend"]["typescript"] = answers["typescript"]
+        config["ninja"]["auth_enabled"] = answers["auth_enabled"]
+        config["ninja"]["camel_case_response"] = answers["camel_case"]
 
-        if use_auth:
+        # 認証タイプは認証が有効な場合のみ追加で質問する
+        if answers["auth_enabled"]:
             auth_type = questionary.select(
                 "認証タイプを選択してください:",
                 choices=[
@@ -145,12 +170,6 @@ def _collect_configuration(
             ).ask()
             config["ninja"]["auth_class"] = auth_type
 
-        # レスポンス形式
-        use_camel_case = questionary.confirm(
-            "レスポンスをキャメルケースにしますか？ (推奨)", default=True
-        ).ask()
-        config["ninja"]["camel_case_response"] = use_camel_case
-
     else:
         # 非対話モード：デフォルト値を使用
         config["frontend"]["framework"] = frontend or "vue"
@@ -160,8 +179,13 @@ def _collect_configuration(
 
 def _create_config_file(config_path: Path, config: Dict[str, Any]):
     """設定ファイルを作成"""
+    from ..config import write_config_cache, yaml_dump
+
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+        yaml_dump(config, f)
+
+    # JSONミラーも更新し、後続コマンドのYAML再パースを不要にする
+    write_config_cache(config_path, config)
 
 
 def _create_directory_structure(project_dir: Path, config: Dict[str, Any]):
@@ -178,15 +202,19 @@ def _create_directory_structure(project_dir: Path, config: Dict[str, Any]):
         "frontend/components",
     ]
 
+    # 重複を除いた葉ディレクトリのみ作成する（親はparents=Trueで暗黙に作られる）
+    created = set()
     for directory in directories:
         dir_path = project_dir / directory
+        if dir_path in created:
+            continue
+
         dir_path.mkdir(parents=True, exist_ok=True)
+        created.add(dir_path)
 
-        # __init__.pyファイルを作成
+        # __init__.pyファイルを作成（touchなら事前のstatが不要）
         if "apis" in directory:
-            init_file = dir_path / "__init__.py"
-            if not init_file.exists():
-                init_file.write_text("", encoding="utf-8")
+            (dir_path / "__init__.py").touch(exist_ok=True)
 
 
 def _generate_initial_files(project_dir: Path, config: Dict[str, Any]):
@@ -197,36 +225,39 @@ def _generate_initial_files(project_dir: Path, config: Dict[str, Any]):
     app_name = config["project"]["django_app"]
     base_dir = project_dir / app_name / "apis" / "ninja"
 
-    # 基本API設定ファイル
-    api_content = generator.generate_base_api(config)
-    file_manager.write_file(base_dir / "api.py", api_content)
-
-    # 共通基盤スキーマ
-    base_schemas_content = generator.generate_base_schemas(config)
-    file_manager.write_file(base_dir / "base_schemas.py", base_schemas_content)
-
-    # ページネーションユーティリティ
-    pagination_content = generator.generate_pagination_utils(config)
-    file_manager.write_file(
-        base_dir / "shared" / "pagination_utils.py", pagination_content
+    # 3つのテンプレートは独立しているため並行して描画する
+    jobs = (
+        (generator.generate_base_api, base_dir / "api.py"),
+        (generator.generate_base_schemas, base_dir / "base_schemas.py"),
+        (generator.generate_pagination_utils, base_dir / "shared" / "pagination_utils.py"),
     )
 
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(render, config) for render, _ in jobs]
+        file_manager.write_files_bulk(
+            (path, future.result()) for future, (_, path) in zip(futures, jobs)
+        )
+
 
 def _setup_frontend(project_dir: Path, config: Dict[str, Any]):
     """フロントエンド設定をセットアップ"""
     generator = APIGenerator()
     file_manager = FileManager()
 
-    # Orval設定ファイル
-    orval_config = generator.generate_orval_config(config)
-    file_manager.write_file(project_dir / "orval.config.ts", orval_config)
-
-    # Fetchラッパー
-    fetch_wrapper = generator.generate_fetch_wrapper(config)
-    file_manager.write_file(
-        project_dir / "frontend" / "api" / "client" / "fetchWrapper.ts", fetch_wrapper
+    jobs = (
+        (generator.generate_orval_config, project_dir / "orval.config.ts"),
+        (
+            generator.generate_fetch_wrapper,
+            project_dir / "frontend" / "api" / "client" / "fetchWrapper.ts",
+        ),
     )
 
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(render, config) for render, _ in jobs]
+        file_manager.write_files_bulk(
+            (path, future.result()) for future, (_, path) in zip(futures, jobs)
+        )
+
     # package.jsonスクリプトの提案
     _suggest_package_scripts(config)
 
@@ -241,26 +272,26 @@ def _suggest_package_scripts(config: Dict[str, Any]):
         "ninja:generate": "npm run prepare:ninja && npm run generate:ninja",
     }
 
-    console.print(
+    _console().print(
         "\n[bold blue]📦 package.jsonに以下のスクリプトを追加してください:[/bold blue]"
     )
     for name, command in scripts.items():
-        console.print(f'  "[cyan]{name}[/cyan]": "[dim]{command}[/dim]"')
+        _console().print(f'  "[cyan]{name}[/cyan]": "[dim]{command}[/dim]"')
 
 
 def _show_next_steps(config: Dict[str, Any]):
     """次のステップを表示"""
-    console.print("\n[bold blue]🚀 次のステップ:[/bold blue]")
-    console.print("1. [cyan]ninja-orval-forge generate[/cyan] でAPIを生成")
-    console.print("2. Django設定にNinja APIのURLパターンを追加")
-    console.print("3. [cyan]python manage.py runserver[/cyan] でサーバー起動")
+    _console().print("\n[bold blue]🚀 次のステップ:[/bold blue]")
+    _console().print("1. [cyan]ninja-orval-forge generate[/cyan] でAPIを生成")
+    _console().print("2. Django設定にNinja APIのURLパターンを追加")
+    _console().print("3. [cyan]python manage.py runserver[/cyan] でサーバー起動")
 
     if config["frontend"]["framework"] != "none":
-        console.print(
+        _console().print(
             "4. [cyan]npm run ninja:generate[/cyan] でTypeScriptクライアント生成"
         )
 
-    console.print(f"\n設定ファイル: [dim].ninja-orval-forge.yml[/dim]")
-    console.print(
+    _console().print(f"\n設定ファイル: [dim].ninja-orval-forge.yml[/dim]")
+    _console().print(
         "ドキュメント: [link]https://github.com/yourusername/ninja-orval-forge[/link]"
     )
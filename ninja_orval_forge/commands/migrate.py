@@ -2,20 +2,26 @@
 DRF移行コマンド実装
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 
 import click
-import questionary
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..analyzers.drf_analyzer import DRFAnalyzer
 from ..generators.api_generator import APIGenerator
 from ..utils.file_manager import FileManager
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _console():
+    """Consoleの遅延シングルトン（rich importを実行時まで遅らせる）"""
+    from rich.console import Console
+
+    return Console()
 
 @click.command()
 @click.option(
@@ -57,51 +63,55 @@ def migrate_command(
     current_dir = Path.cwd()
     app_path = current_dir / app
     
-    console.print(f"\n[bold green]DRF → Django Ninja 移行ツール[/bold green]")
-    console.print(f"対象アプリ: [cyan]{app}[/cyan]")
+    _console().print(f"\n[bold green]DRF → Django Ninja 移行ツール[/bold green]")
+    _console().print(f"対象アプリ: [cyan]{app}[/cyan]")
     
     # アプリケーションの存在確認
     if not app_path.exists():
-        console.print(f"[red]❌ アプリケーション '{app}' が見つかりません。[/red]")
+        _console().print(f"[red]❌ アプリケーション '{app}' が見つかりません。[/red]")
         return
     
     # DRFコードの分析
     analyzer = DRFAnalyzer(app_path)
     
     try:
-        console.print("\n[blue]🔍 DRFコードを分析中...[/blue]")
+        _console().print("\n[blue]🔍 DRFコードを分析中...[/blue]")
         analysis_result = analyzer.analyze_app()
         
         if not analysis_result["serializers"] and not analysis_result["viewsets"]:
-            console.print("[yellow]⚠️ DRFのSerializerやViewSetが見つかりませんでした。[/yellow]")
+            _console().print("[yellow]⚠️ DRFのSerializerやViewSetが見つかりませんでした。[/yellow]")
             return
             
     except Exception as e:
-        console.print(f"[red]❌ 分析エラー: {str(e)}[/red]")
+        _console().print(f"[red]❌ 分析エラー: {str(e)}[/red]")
         return
     
     # 分析結果の表示
     _show_analysis_result(analysis_result)
     
     # 移行計画の確認
-    if interactive and not questionary.confirm("この内容で移行を続行しますか？").ask():
-        console.print("[yellow]移行をキャンセルしました。[/yellow]")
-        return
+    if interactive:
+        import questionary
+
+        if not questionary.confirm("この内容で移行を続行しますか？").ask():
+            _console().print("[yellow]移行をキャンセルしました。[/yellow]")
+            return
     
     if dry_run:
-        console.print("\n[blue]🧪 ドライラン完了: 実際の変更は行われませんでした。[/blue]")
+        _console().print("\n[blue]🧪 ドライラン完了: 実際の変更は行われませんでした。[/blue]")
         return
     
     # 移行の実行
     _execute_migration(current_dir, app, analysis_result, backup)
     
-    console.print(f"\n[bold green]✅ {app} の移行が完了しました！[/bold green]")
+    _console().print(f"\n[bold green]✅ {app} の移行が完了しました！[/bold green]")
     _show_migration_summary(app)
 
 def _show_analysis_result(result: Dict[str, Any]):
     """分析結果を表示"""
-    
-    console.print(f"\n[bold blue]📊 分析結果:[/bold blue]")
+    from rich.table import Table
+
+    _console().print(f"\n[bold blue]📊 分析結果:[/bold blue]")
     
     # Serializer一覧
     if result["serializers"]:
@@ -119,7 +129,7 @@ def _show_analysis_result(result: Dict[str, Any]):
                 str(len(serializer.get("fields", [])))
             )
         
-        console.print(table)
+        _console().print(table)
     
     # ViewSet一覧
     if result["viewsets"]:
@@ -138,13 +148,13 @@ def _show_analysis_result(result: Dict[str, Any]):
                 actions
             )
         
-        console.print(table)
+        _console().print(table)
     
     # 検出された問題
     if result.get("issues"):
-        console.print(f"\n[bold yellow]⚠️ 検出された問題:[/bold yellow]")
+        _console().print(f"\n[bold yellow]⚠️ 検出された問題:[/bold yellow]")
         for issue in result["issues"]:
-            console.print(f"  • {issue}")
+            _console().print(f"  • {issue}")
 
 def _execute_migration(
     project_dir: Path,
@@ -160,143 +170,214 @@ def _execute_migration(
     # プロジェクト設定の読み込み
     config = _load_project_config(project_dir)
     if not config:
-        console.print("[red]❌ プロジェクト設定が見つかりません。[/red]")
+        _console().print("[red]❌ プロジェクト設定が見つかりません。[/red]")
         return
     
     ninja_base_dir = project_dir / config["project"]["django_app"] / "apis" / "ninja"
-    
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    # 共通プレフィックスは1回だけ構築し、作成済みディレクトリはdictで再利用する
+    api_views_root = ninja_base_dir / "api_views"
+    feature_dirs: Dict[str, Path] = {}
+
+    def _ensure_feature_dir(feature_name: str) -> Path:
+        feature_dir = feature_dirs.get(feature_name)
+        if feature_dir is None:
+            feature_dir = api_views_root / feature_name
+            feature_dir.mkdir(parents=True, exist_ok=True)
+            feature_dirs[feature_name] = feature_dir
+        return feature_dir
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=_console(),
+        # 大量の項目を変換しても再描画は秒4回までに抑える
+        refresh_per_second=4,
     ) as progress:
-        
+
         # バックアップ作成
         if backup:
             task1 = progress.add_task("既存ファイルをバックアップ中...", total=None)
             _create_backup(project_dir, app_name)
             progress.update(task1, completed=100)
         
+        max_workers = min(8, os.cpu_count() or 1)
+
         # Serializerの変換
         if analysis_result["serializers"]:
             task2 = progress.add_task("Serializerをスキーマに変換中...", total=len(analysis_result["serializers"]))
-            
-            for i, serializer in enumerate(analysis_result["serializers"]):
-                schema_content = generator.convert_serializer_to_schema(serializer, config)
-                
-                # 出力先の決定
+
+            # 出力先ディレクトリは先にまとめて作成し、ワーカー間の競合を避ける
+            schema_jobs = []
+            for serializer in analysis_result["serializers"]:
                 feature_name = _extract_feature_name(serializer["class_name"])
-                feature_dir = ninja_base_dir / "api_views" / feature_name
-                feature_dir.mkdir(parents=True, exist_ok=True)
-                
-                # スキーマファイル作成
-                schema_path = feature_dir / "schema.py"
-                file_manager.write_file(schema_path, schema_content)
-                
-                progress.update(task2, advance=1)
+                feature_dir = _ensure_feature_dir(feature_name)
+                schema_jobs.append((serializer, feature_dir / "schema.py"))
+
+            # テンプレート描画をスレッドプールへファンアウトする
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        generator.convert_serializer_to_schema, serializer, config
+                    ): schema_path
+                    for serializer, schema_path in schema_jobs
+                }
+
+                # 書き込みと進捗更新はメインスレッドで行う（Progressはスレッド非対応）
+                for future in as_completed(futures):
+                    file_manager.write_file(futures[future], future.result())
+                    progress.update(task2, advance=1)
         
         # ViewSetの変換
         if analysis_result["viewsets"]:
             task3 = progress.add_task("ViewSetをビューに変換中...", total=len(analysis_result["viewsets"]))
-            
-            for i, viewset in enumerate(analysis_result["viewsets"]):
-                views_content = generator.convert_viewset_to_views(viewset, config)
-                
-                # 出力先の決定
+
+            feature_names = []
+            views_jobs = []
+            for viewset in analysis_result["viewsets"]:
                 feature_name = _extract_feature_name(viewset["class_name"])
-                feature_dir = ninja_base_dir / "api_views" / feature_name
-                feature_dir.mkdir(parents=True, exist_ok=True)
-                
-                # ビューファイル作成
-                views_path = feature_dir / "views.py"
-                file_manager.write_file(views_path, views_content)
-                
-                # ルーター登録
-                _update_main_api_file(project_dir, feature_name, config)
-                
-                progress.update(task3, advance=1)
+                feature_dir = _ensure_feature_dir(feature_name)
+                feature_names.append(feature_name)
+                views_jobs.append((viewset, feature_dir / "views.py"))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        generator.convert_viewset_to_views, viewset, config
+                    ): views_path
+                    for viewset, views_path in views_jobs
+                }
+
+                for future in as_completed(futures):
+                    file_manager.write_file(futures[future], future.result())
+                    progress.update(task3, advance=1)
+
+            # ルーター登録はapi.pyを1回だけ読み書きしてまとめて行う
+            _update_main_api_file(project_dir, feature_names, config)
 
 def _create_backup(project_dir: Path, app_name: str):
     """既存ファイルのバックアップを作成"""
     import shutil
     from datetime import datetime
-    
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_dir = project_dir / f"backup_drf_migration_{timestamp}"
-    
+
     # アプリケーションディレクトリをバックアップ
+    # 移行が書き換えるapis/ninja配下はバイトコピーし、それ以外だけ
+    # ハードリンクする。リンクを共有したままr+/write_textで上書きされると
+    # バックアップ側も同じinodeごと書き換わってしまうため。
     app_source = project_dir / app_name
-    if app_source.exists():
+    if not app_source.exists():
+        return
+
+    ninja_prefix = str(app_source / "apis" / "ninja") + os.sep
+
+    def _snapshot(src: str, dst: str) -> None:
+        if src.startswith(ninja_prefix):
+            shutil.copyfile(src, dst)
+        else:
+            os.link(src, dst)
+
+    try:
+        shutil.copytree(app_source, backup_dir / app_name, copy_function=_snapshot)
+    except OSError:
+        # リンクできない場合は作りかけのスナップショットを破棄して通常コピー
+        if backup_dir.exists():
+            shutil.rmtree(backup_dir)
         shutil.copytree(app_source, backup_dir / app_name)
-        console.print(f"[dim]バックアップ作成: {backup_dir}[/dim]")
 
+    _console().print(f"[dim]バックアップ作成: {backup_dir}[/dim]")
+
+# 識別子語幹向けの複数形化ルール（inflectエンジンのロードを避ける）
+_ES_SUFFIX = re.compile(r"(?:[sxz]|ch|sh)$")
+_IES_SUFFIX = re.compile(r"[^aeiou]y$")
+
+@lru_cache(maxsize=None)
+def _pluralize(name: str) -> str:
+    """英語識別子の語幹を複数形に変換"""
+    if _ES_SUFFIX.search(name):
+        return name + "es"
+    if _IES_SUFFIX.search(name):
+        return name[:-1] + "ies"
+    return name + "s"
+
+@lru_cache(maxsize=None)
 def _extract_feature_name(class_name: str) -> str:
     """クラス名から機能名を抽出"""
     # UserSerializer -> users
     # ProductViewSet -> products
-    import inflect
-    
-    p = inflect.engine()
-    
+
     # 末尾のSerializer, ViewSetを除去
     name = class_name
     for suffix in ["Serializer", "ViewSet", "View"]:
         if name.endswith(suffix):
             name = name[:-len(suffix)]
             break
-    
+
     # 複数形に変換
-    plural = p.plural(name.lower())
-    return plural
+    return _pluralize(name.lower())
 
 def _load_project_config(project_dir: Path):
     """プロジェクト設定を読み込み"""
-    from ..config import get_config_path
-    import yaml
-    
-    config_path = get_config_path(project_dir)
-    if not config_path.exists():
-        return None
-    
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    from ..config import get_config_path, load_config_cached
 
-def _update_main_api_file(project_dir: Path, feature_name: str, config: dict):
-    """メインのapi.pyファイルにルーターを追加"""
+    return load_config_cached(get_config_path(project_dir))
+
+def _update_main_api_file(project_dir: Path, feature_names: List[str], config: dict):
+    """メインのapi.pyファイルにルーターをまとめて追加
+
+    機能ごとに読み書きを繰り返さず、1回の読み込み・書き込みで全機能分の
+    インポートとルーター登録を反映する。
+    """
     app_name = config["project"]["django_app"]
     api_file = project_dir / app_name / "apis" / "ninja" / "api.py"
-    
-    if not api_file.exists():
+
+    if not api_file.exists() or not feature_names:
         return
-    
-    content = api_file.read_text(encoding="utf-8")
-    
-    # ルーター追加（重複チェック付き）
-    import_line = f"from {app_name}.apis.ninja.api_views.{feature_name}.views import router as {feature_name}_router"
-    router_line = f'api.add_router("", {feature_name}_router)'
-    
-    if import_line not in content:
-        content = import_line + "\n" + content
-    
-    if router_line not in content:
-        content += "\n" + router_line
-    
-    api_file.write_text(content, encoding="utf-8")
+
+    # 読み書きを1つのファイルハンドルで行い、open/closeを1往復に抑える
+    with open(api_file, "r+", encoding="utf-8") as f:
+        lines = f.read().split("\n")
+        line_set = set(lines)
+
+        # 不足しているインポート・ルーター行を集める（重複チェック付き）
+        import_lines = []
+        router_lines = []
+        for feature_name in feature_names:
+            import_line = f"from {app_name}.apis.ninja.api_views.{feature_name}.views import router as {feature_name}_router"
+            router_line = f'api.add_router("", {feature_name}_router)'
+
+            if import_line not in line_set:
+                import_lines.append(import_line)
+                line_set.add(import_line)
+            if router_line not in line_set:
+                router_lines.append(router_line)
+                line_set.add(router_line)
+
+        if not import_lines and not router_lines:
+            return
+
+        f.seek(0)
+        f.write("\n".join(import_lines + lines + router_lines))
+        f.truncate()
 
 def _show_migration_summary(app_name: str):
     """移行完了後のサマリーを表示"""
-    console.print(f"\n[bold blue]📝 移行サマリー:[/bold blue]")
-    console.print(f"  ✅ DRF Serializerをスキーマに変換完了")
-    console.print(f"  ✅ DRF ViewSetをビューに変換完了")
-    console.print(f"  ✅ ルーター登録完了")
-    
-    console.print(f"\n[bold blue]🔄 次のステップ:[/bold blue]")
-    console.print("1. [cyan]python manage.py runserver[/cyan] でサーバー起動")
-    console.print("2. http://localhost:8000/ninja_api/docs でAPIドキュメント確認")
-    console.print("3. [cyan]npm run ninja:generate[/cyan] でTypeScriptクライアント生成")
-    console.print("4. 既存のDRFコードをテストして段階的に置き換え")
-    
-    console.print(f"\n[bold yellow]⚠️ 注意事項:[/bold yellow]")
-    console.print("  • 生成されたコードは確認・調整が必要です")
-    console.print("  • カスタムバリデーションやパーミッションは手動で移行してください")
-    console.print("  • テストコードも更新が必要です")
\ No newline at end of file
+    _console().print(f"\n[bold blue]📝 移行サマリー:[/bold blue]")
+    _console().print(f"  ✅ DRF Serializerをスキーマに変換完了")
+    _console().print(f"  ✅ DRF ViewSetをビューに変換完了")
+    _console().print(f"  ✅ ルーター登録完了")
+    
+    _console().print(f"\n[bold blue]🔄 次のステップ:[/bold blue]")
+    _console().print("1. [cyan]python manage.py runserver[/cyan] でサーバー起動")
+    _console().print("2. http://localhost:8000/ninja_api/docs でAPIドキュメント確認")
+    _console().print("3. [cyan]npm run ninja:generate[/cyan] でTypeScriptクライアント生成")
+    _console().print("4. 既存のDRFコードをテストして段階的に置き換え")
+    
+    _console().print(f"\n[bold yellow]⚠️ 注意事項:[/bold yellow]")
+    _console().print("  • 生成されたコードは確認・調整が必要です")
+    _console().print("  • カスタムバリデーションやパーミッションは手動で移行してください")
+    _console().print("  • テストコードも更新が必要です")
\ No newline at end of file
@@ -1,6 +1,7 @@
 """設定モジュール"""
 
 from .settings import (
+    Config,
     DEFAULT_CONFIG,
     DJANGO_TO_PYDANTIC_MAPPING,
     PYDANTIC_IMPORTS,
@@ -11,9 +12,15 @@ from .settings import (
     CONFIG_FILE_NAME,
     get_template_dir,
     get_config_path,
+    new_default_config,
+    load_config_cached,
+    write_config_cache,
+    yaml_dump,
+    yaml_load,
 )
 
 __all__ = [
+    "Config",
     "DEFAULT_CONFIG",
     "DJANGO_TO_PYDANTIC_MAPPING", 
     "PYDANTIC_IMPORTS",
@@ -24,4 +31,9 @@ __all__ = [
     "CONFIG_FILE_NAME",
     "get_template_dir",
     "get_config_path",
+    "new_default_config",
+    "load_config_cached",
+    "write_config_cache",
+    "yaml_dump",
+    "yaml_load",
 ]
\ No newline at end of file
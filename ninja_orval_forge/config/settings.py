@@ -2,11 +2,72 @@
 ninja-orval-forge設定モジュール
 """
 
+import copy
+import json
+import sys
+import types
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+try:
+    from typing import TypedDict
+except ImportError:  # Python 3.7
+    TypedDict = dict
+
+
+class ProjectConfig(TypedDict):
+    name: str
+    django_app: str
+    api_prefix: str
+    api_version: str
+    api_description: str
+
+
+class NinjaConfig(TypedDict):
+    auth_enabled: bool
+    auth_class: str
+    camel_case_response: bool
+    auto_openapi: bool
+
+
+class OrvalConfig(TypedDict):
+    output_path: str
+    client_type: str
+    split_mode: str
+    mutator_name: str
+    ts_schemas_dir: str
+    composables_dir: str
+
+
+class FrontendConfig(TypedDict):
+    framework: str
+    typescript: bool
+    composition_api: bool
+
+
+class TemplatesConfig(TypedDict):
+    pagination_limit: int
+    max_page_size: int
+    default_ordering: str
+    include_tests: bool
+
+
+class Config(TypedDict):
+    """プロジェクト設定全体
+
+    実体はYAML/JSONとそのまま往復できるプレーンなdictのまま、
+    ネストしたキーアクセスを静的に型検査できるようにする。
+    """
+
+    project: ProjectConfig
+    ninja: NinjaConfig
+    orval: OrvalConfig
+    frontend: FrontendConfig
+    templates: TemplatesConfig
+
 
 # デフォルト設定
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG: Config = {
     "project": {
         "name": "",
         "django_app": "main",
@@ -42,7 +103,7 @@ DEFAULT_CONFIG = {
 }
 
 # フィールドタイプマッピング
-DJANGO_TO_PYDANTIC_MAPPING: Dict[str, str] = {
+_DJANGO_TO_PYDANTIC_MAPPING: Dict[str, str] = {
     "AutoField": "int",
     "BigAutoField": "int",
     "BigIntegerField": "int",
@@ -75,15 +136,24 @@ DJANGO_TO_PYDANTIC_MAPPING: Dict[str, str] = {
     "ManyToManyField": "List[int]",
 }
 
+# 生成時に繰り返し参照されるため、キーと値をinternした不変マップとして公開する
+# internによりdict探索がポインタ比較の高速パスを通れる
+DJANGO_TO_PYDANTIC_MAPPING: Mapping[str, str] = types.MappingProxyType(
+    {
+        sys.intern(key): sys.intern(value)
+        for key, value in _DJANGO_TO_PYDANTIC_MAPPING.items()
+    }
+)
+
 # 必要なimport文
-PYDANTIC_IMPORTS: List[str] = [
+PYDANTIC_IMPORTS: Sequence[str] = (
     "from pydantic import BaseModel, Field, ConfigDict",
     "from typing import List, Optional, Dict, Any",
     "from datetime import datetime, date, time, timedelta",
     "from decimal import Decimal",
     "from uuid import UUID",
     "from pydantic import EmailStr, HttpUrl",
-]
+)
 
 # 命名規則
 NAMING_CONVENTIONS = {
@@ -117,10 +187,23 @@ TEMPLATE_PATHS = {
 # 設定ファイル名
 CONFIG_FILE_NAME = ".ninja-orval-forge.yml"
 
+# テンプレートディレクトリ（プロセス中は不変なのでimport時に1回だけ解決）
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+def new_default_config() -> Config:
+    """デフォルト設定の独立したコピーを生成
+
+    DEFAULT_CONFIG.copy()は浅いコピーでネストしたdictを共有してしまい、
+    呼び出し側の変更が共有のデフォルト値を汚染するため、必ずこの
+    ファクトリを経由する。
+    """
+    return copy.deepcopy(DEFAULT_CONFIG)
+
 
 def get_template_dir() -> Path:
     """テンプレートディレクトリのパスを取得"""
-    return Path(__file__).parent.parent / "templates"
+    return TEMPLATE_DIR
 
 
 def get_config_path(project_dir: Path = None) -> Path:
@@ -128,3 +211,61 @@ def get_config_path(project_dir: Path = None) -> Path:
     if project_dir is None:
         project_dir = Path.cwd()
     return project_dir / CONFIG_FILE_NAME
+
+
+def yaml_load(stream) -> Any:
+    """YAMLを読み込み（C拡張のLoaderが利用可能なら使用）"""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def yaml_dump(data: Any, stream) -> None:
+    """YAMLを書き出し（C拡張のDumperが利用可能なら使用）"""
+    import yaml
+
+    yaml.dump(
+        data,
+        stream,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+        allow_unicode=True,
+    )
+
+
+def _config_cache_path(config_path: Path) -> Path:
+    """設定のJSONミラーファイルのパスを取得"""
+    return config_path.with_suffix(".cache.json")
+
+
+def write_config_cache(config_path: Path, config: Dict[str, Any]) -> None:
+    """設定のJSONミラーを書き出し（次回以降の読み込み高速化用）"""
+    try:
+        with open(_config_cache_path(config_path), "w", encoding="utf-8") as f:
+            json.dump(config, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def load_config_cached(config_path: Path) -> Optional[Dict[str, Any]]:
+    """設定ファイルを読み込み
+
+    YAMLのパースはJSONより大幅に遅いため、初回パース結果をJSONとして
+    ミラーし、YAMLより新しければそちらを読む。
+    """
+    if not config_path.exists():
+        return None
+
+    cache_path = _config_cache_path(config_path)
+    try:
+        if cache_path.stat().st_mtime >= config_path.stat().st_mtime:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml_load(f)
+
+    write_config_cache(config_path, config)
+    return config
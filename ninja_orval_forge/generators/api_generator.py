@@ -2,43 +2,167 @@
 API生成器実装
 """
 
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 import inflect
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, TemplateError
 
+from ..config import DJANGO_TO_PYDANTIC_MAPPING as _FIELD_TYPE_MAPPING
 from ..config import get_template_dir, TEMPLATE_PATHS
 
 
-class APIGenerator:
-    """Django Ninja API生成器"""
+class FieldInfo(NamedTuple):
+    """変換済みモデルフィールド
 
-    def __init__(self):
-        template_dir = get_template_dir()
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
+    dictより省メモリで、Jinjaテンプレートからは同じく属性参照できる。
+    """
+
+    name: str
+    type_hint: str
+    optional: bool
+    description: str
+
+
+@lru_cache(maxsize=1)
+def _inflect_engine():
+    """inflectエンジンの遅延シングルトン（構築コストが高いため共有する）"""
+    return inflect.engine()
+
+
+# 変換テーブルは1回だけ構築し、translateの単一パスで置換する
+_KEBAB_TABLE = str.maketrans("_", "-")
+_SNAKE_TABLE = str.maketrans("-", "_")
+
+
+# テンプレートフィルター
+def _kebab_case(text: str) -> str:
+    """kebab-caseに変換"""
+    return text.translate(_KEBAB_TABLE).lower()
+
+
+@lru_cache(maxsize=4096)
+def _camel_case(text: str) -> str:
+    """camelCaseに変換（同じフィールド名が繰り返し渡されるためメモ化）"""
+    components = text.split("_")
+    return components[0] + "".join(x.title() for x in components[1:])
+
+
+def _snake_case(text: str) -> str:
+    """snake_caseに変換"""
+    return text.lower().translate(_SNAKE_TABLE)
+
+
+@lru_cache(maxsize=1024)
+def _plural(text: str) -> str:
+    """複数形に変換（inflectの規則評価が重いためメモ化）"""
+    return _inflect_engine().plural(text)
+
+
+# 先頭およびアンダースコア直後の小文字だけを1パスで大文字化する
+_PASCAL_RE = re.compile(r"(?:^|_)([a-z])")
+
+
+@lru_cache(maxsize=4096)
+def _pascal_case(text: str) -> str:
+    """PascalCaseに変換（同じ機能名が繰り返し渡されるためメモ化）"""
+    return _PASCAL_RE.sub(lambda m: m.group(1).upper(), text).replace("_", "")
+
+
+def _render_feature(
+    job: Tuple[str, Dict[str, Any], tuple, Dict[str, Any]]
+) -> Tuple[str, Dict[str, str]]:
+    """1機能分のテンプレートを描画（ワーカープロセスからも呼べるようpicklable）"""
+    feature_name, model_info, operations, config = job
+    rendered = APIGenerator().generate_feature(
+        feature_name, model_info, operations, config
+    )
+    return feature_name, rendered
+
+
+# Environmentはテンプレートディレクトリの走査とフィルター登録を伴うため、
+# 全APIGeneratorインスタンスで1つを共有する
+_SHARED_ENV: Optional[Environment] = None
+
+
+def _get_env() -> Environment:
+    """フィルター登録済みの共有Environmentを取得"""
+    global _SHARED_ENV
+    if _SHARED_ENV is None:
+        import os
+
+        from jinja2 import FileSystemBytecodeCache
+
+        # コンパイル済みバイトコードをディスクへ永続化し、プロセスを跨いで再利用する
+        # キャッシュはmarshalで読み込まれるため、共有の/tmpではなく
+        # ユーザー専用ディレクトリ（0700・所有者確認付き）に置く
+        cache_dir = Path.home() / ".cache" / "ninja-orval-forge" / "jinja"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            os.chmod(cache_dir, 0o700)
+            if hasattr(os, "getuid") and cache_dir.stat().st_uid != os.getuid():
+                raise OSError("cache directory owned by another user")
+            bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        except OSError:
+            bytecode_cache = None
+
+        env = Environment(
+            loader=FileSystemLoader(get_template_dir()),
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+            optimized=True,
+            cache_size=400,
         )
-        self.inflect_engine = inflect.engine()
+        env.filters["kebab_case"] = _kebab_case
+        env.filters["camel_case"] = _camel_case
+        env.filters["snake_case"] = _snake_case
+        env.filters["plural"] = _plural
+        _SHARED_ENV = env
+
+    return _SHARED_ENV
 
-        # カスタムフィルターの追加
-        self.env.filters["kebab_case"] = self._kebab_case
-        self.env.filters["camel_case"] = self._camel_case
-        self.env.filters["snake_case"] = self._snake_case
-        self.env.filters["plural"] = self._plural
+
+class APIGenerator:
+    """Django Ninja API生成器"""
+
+    def __init__(self):
+        self.env = _get_env()
+
+        # 全テンプレートを先にコンパイルし、生成ループ内のget_template呼び出しを省く
+        # コンパイルできないテンプレートは使用時にエラーを報告させる
+        self._templates = {}
+        for key, path in TEMPLATE_PATHS.items():
+            try:
+                self._templates[key] = self.env.get_template(path)
+            except TemplateError:
+                pass
+
+    def _get_template(self, key: str):
+        """コンパイル済みテンプレートを取得"""
+        template = self._templates.get(key)
+        if template is None:
+            template = self.env.get_template(TEMPLATE_PATHS[key])
+            self._templates[key] = template
+        return template
 
     def generate_base_api(self, config: Dict[str, Any]) -> str:
         """基本API設定ファイルを生成"""
-        template = self.env.get_template(TEMPLATE_PATHS["django_api"])
+        template = self._get_template("django_api")
+
+        # ネストしたdictの降下は1回だけにする
+        project = config["project"]
+        ninja = config["ninja"]
 
         context = {
-            "project_name": config["project"]["name"],
-            "api_version": config["project"]["api_version"],
-            "api_description": config["project"]["api_description"],
-            "app_name": config["project"]["django_app"],
-            "auth_enabled": config["ninja"]["auth_enabled"],
-            "auth_class": config["ninja"]["auth_class"],
+            "project_name": project["name"],
+            "api_version": project["api_version"],
+            "api_description": project["api_description"],
+            "app_name": project["django_app"],
+            "auth_enabled": ninja["auth_enabled"],
+            "auth_class": ninja["auth_class"],
             "features": config.get("features", []),
         }
 
@@ -46,12 +170,14 @@ class APIGenerator:
 
     def generate_base_schemas(self, config: Dict[str, Any]) -> str:
         """共通Pydanticスキーマを生成"""
-        template = self.env.get_template(TEMPLATE_PATHS["django_base_schemas"])
+        template = self._get_template("django_base_schemas")
+
+        templates = config["templates"]
 
         context = {
             "app_name": config["project"]["django_app"],
-            "default_page_size": config["templates"]["pagination_limit"],
-            "max_page_size": config["templates"]["max_page_size"],
+            "default_page_size": templates["pagination_limit"],
+            "max_page_size": templates["max_page_size"],
             "camel_case_enabled": config["ninja"]["camel_case_response"],
         }
 
@@ -59,7 +185,7 @@ class APIGenerator:
 
     def generate_pagination_utils(self, config: Dict[str, Any]) -> str:
         """ページネーションユーティリティを生成"""
-        template = self.env.get_template(TEMPLATE_PATHS["django_pagination"])
+        template = self._get_template("django_pagination")
 
         context = {
             "app_name": config["project"]["django_app"],
@@ -69,53 +195,44 @@ class APIGenerator:
 
         return template.render(**context)
 
-    def generate_schema(
+    def _build_feature_context(
         self,
         feature_name: str,
         model_info: Dict[str, Any],
         operations: tuple,
         config: Dict[str, Any],
-    ) -> str:
-        """Pydanticスキーマを生成"""
-        template = self.env.get_template(TEMPLATE_PATHS["django_schema"])
+    ) -> Dict[str, Any]:
+        """スキーマ・ビュー両テンプレートで共有するコンテキストを構築
 
+        余分なキーはJinjaが無視するため、両テンプレートの和集合を1つの
+        dictにまとめてフィールド走査を1回で済ませる。
+        """
         model_name = self._to_pascal_case(feature_name.rstrip("s"))  # usersからUser
+        model_class = model_info.get("model_class", model_name)
 
-        context = {
+        # ネストしたdictの降下は1回だけにする
+        model_info_get = model_info.get
+
+        # フィールドの変換と型スキャンは1回だけ行い、派生リストはそこから絞り込む
+        raw_fields = model_info.get("fields", [])
+        converted_fields = self._convert_model_fields(raw_fields)
+        email_field_used, url_field_used = self._field_type_flags(raw_fields)
+
+        return {
             "model_name": model_name,
-            "model_description": model_info.get("description", model_name),
+            "model_class": model_class,
+            "model_description": model_info_get("description", model_name),
             "app_name": config["project"]["django_app"],
-            "fields": self._convert_model_fields(model_info.get("fields", [])),
-            "computed_fields": model_info.get("computed_fields", []),
+            "fields": converted_fields,
+            "computed_fields": model_info_get("computed_fields", []),
             "camel_case_enabled": config["ninja"]["camel_case_response"],
             "list_schema_needed": "list" in operations,
             "create_schema_needed": "create" in operations,
             "update_schema_needed": "update" in operations,
-            "create_fields": self._get_create_fields(model_info.get("fields", [])),
-            "update_fields": self._get_update_fields(model_info.get("fields", [])),
-            "email_field_used": self._has_email_field(model_info.get("fields", [])),
-            "url_field_used": self._has_url_field(model_info.get("fields", [])),
-        }
-
-        return template.render(**context)
-
-    def generate_views(
-        self,
-        feature_name: str,
-        model_info: Dict[str, Any],
-        operations: tuple,
-        config: Dict[str, Any],
-    ) -> str:
-        """Django Ninjaビューを生成"""
-        template = self.env.get_template(TEMPLATE_PATHS["django_views"])
-
-        model_name = self._to_pascal_case(feature_name.rstrip("s"))
-        model_class = model_info.get("model_class", model_name)
-
-        context = {
-            "model_name": model_name,
-            "model_class": model_class,
-            "app_name": config["project"]["django_app"],
+            "create_fields": self._get_create_fields(converted_fields),
+            "update_fields": self._get_update_fields(converted_fields),
+            "email_field_used": email_field_used,
+            "url_field_used": url_field_used,
             "tag_name": feature_name,
             "resource_name": feature_name,
             "resource_path": feature_name,
@@ -131,55 +248,135 @@ class APIGenerator:
             "create_description": f"新しい{model_name}を作成",
             "update_description": f"{model_name}を更新",
             "delete_description": f"{model_name}を削除",
-            "path_params": model_info.get("path_params", []),
-            "path_filters": model_info.get("path_filters", []),
-            "list_filters": model_info.get("list_filters", []),
+            "path_params": model_info_get("path_params", []),
+            "path_filters": model_info_get("path_filters", []),
+            "list_filters": model_info_get("list_filters", []),
             "permissions_enabled": False,  # 今回は簡単のため無効
         }
 
-        return template.render(**context)
+    def generate_feature(
+        self,
+        feature_name: str,
+        model_info: Dict[str, Any],
+        operations: tuple,
+        config: Dict[str, Any],
+    ) -> Dict[str, str]:
+        """同一機能のスキーマとビューをまとめて生成"""
+        context = self._build_feature_context(
+            feature_name, model_info, operations, config
+        )
+
+        return {
+            "schema.py": self._get_template("django_schema").render(**context),
+            "views.py": self._get_template("django_views").render(**context),
+        }
+
+    def generate_all_features(
+        self,
+        features: List[Tuple[str, Dict[str, Any], tuple]],
+        config: Dict[str, Any],
+    ) -> Dict[str, Dict[str, str]]:
+        """複数機能をまとめて生成
+
+        機能ごとの描画は独立しているため、複数件ある場合はプロセスプールに
+        ファンアウトしてコア数分スケールさせる。プロセスを生成できない
+        環境では逐次描画にフォールバックする。
+        """
+        jobs = [
+            (feature_name, model_info, operations, config)
+            for feature_name, model_info, operations in features
+        ]
+
+        if len(jobs) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            try:
+                with ProcessPoolExecutor() as executor:
+                    return dict(executor.map(_render_feature, jobs))
+            except OSError:
+                pass
+
+        return dict(_render_feature(job) for job in jobs)
+
+    def generate_schema(
+        self,
+        feature_name: str,
+        model_info: Dict[str, Any],
+        operations: tuple,
+        config: Dict[str, Any],
+    ) -> str:
+        """Pydanticスキーマを生成"""
+        context = self._build_feature_context(
+            feature_name, model_info, operations, config
+        )
+        return self._get_template("django_schema").render(**context)
+
+    def generate_views(
+        self,
+        feature_name: str,
+        model_info: Dict[str, Any],
+        operations: tuple,
+        config: Dict[str, Any],
+    ) -> str:
+        """Django Ninjaビューを生成"""
+        context = self._build_feature_context(
+            feature_name, model_info, operations, config
+        )
+        return self._get_template("django_views").render(**context)
+
+    # 設定に依存しないコンテキストの定数部分（呼び出しごとに再構築しない）
+    _ORVAL_CONST = {
+        "api_name": "ninjaApi",
+        "clean_output": True,
+        "prettier_enabled": True,
+        "use_mutator": True,
+        "mutator_path": "./frontend/api/client/fetchWrapper.ts",
+        "hooks": {"afterAllFilesWrite": "prettier --write"},
+    }
+
+    _FETCH_WRAPPER_CONST = {
+        "default_timeout": 30000,
+        "content_type": "application/json",
+        "accept_header": "application/json",
+        "credentials_mode": "include",
+        "csrf_enabled": True,  # Django用にCSRF有効
+        "auth_storage": "localStorage",
+        "auth_token_key": "authToken",
+    }
 
     def generate_orval_config(self, config: Dict[str, Any]) -> str:
         """Orval設定ファイルを生成"""
-        template = self.env.get_template(TEMPLATE_PATHS["orval_config"])
+        template = self._get_template("orval_config")
 
         app_name = config["project"]["django_app"]
+        orval = config["orval"]
 
         context = {
-            "api_name": "ninjaApi",
+            **self._ORVAL_CONST,
             "openapi_path": f"./{app_name}/apis/ninja/openapi/ninja_api_schema.json",
-            "output_path": config["orval"]["output_path"],
-            "client_type": config["orval"]["client_type"],
-            "split_mode": config["orval"]["split_mode"],
-            "clean_output": True,
-            "prettier_enabled": True,
-            "use_mutator": True,
-            "mutator_path": f"./frontend/api/client/fetchWrapper.ts",
-            "mutator_name": config["orval"]["mutator_name"],
-            "ts_schemas_path": config["orval"]["ts_schemas_dir"],
-            "hooks": {"afterAllFilesWrite": "prettier --write"},
+            "output_path": orval["output_path"],
+            "client_type": orval["client_type"],
+            "split_mode": orval["split_mode"],
+            "mutator_name": orval["mutator_name"],
+            "ts_schemas_path": orval["ts_schemas_dir"],
         }
 
         return template.render(**context)
 
     def generate_fetch_wrapper(self, config: Dict[str, Any]) -> str:
         """Fetchラッパーを生成"""
-        template = self.env.get_template(TEMPLATE_PATHS["fetch_wrapper"])
+        template = self._get_template("fetch_wrapper")
+
+        ninja = config["ninja"]
 
         context = {
+            **self._FETCH_WRAPPER_CONST,
             "project_name": config["project"]["name"],
             "mutator_name": config["orval"]["mutator_name"],
-            "default_timeout": 30000,
-            "content_type": "application/json",
-            "accept_header": "application/json",
-            "credentials_mode": "include",
-            "csrf_enabled": True,  # Django用にCSRF有効
-            "auth_enabled": config["ninja"]["auth_enabled"],
+            "auth_enabled": ninja["auth_enabled"],
             "auth_scheme": (
-                "Bearer" if config["ninja"]["auth_class"] == "JWTAuth" else "Token"
+                "Bearer" if ninja["auth_class"] == "JWTAuth" else "Token"
             ),
-            "auth_storage": "localStorage",
-            "auth_token_key": "authToken",
         }
 
         return template.render(**context)
@@ -201,67 +398,64 @@ class APIGenerator:
     # ヘルパーメソッド
     def _convert_model_fields(
         self, fields: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[FieldInfo]:
         """Djangoモデルフィールドを変換"""
-        from ..config import DJANGO_TO_PYDANTIC_MAPPING
+        # ループ内のグローバル/属性参照をローカルに束縛して回す
+        mapping_get = _FIELD_TYPE_MAPPING.get
 
         converted_fields = []
         for field in fields:
-            field_type = field.get("type", "CharField")
-            pydantic_type = DJANGO_TO_PYDANTIC_MAPPING.get(field_type, "str")
-
+            field_get = field.get
             converted_fields.append(
-                {
-                    "name": field["name"],
-                    "type_hint": pydantic_type,
-                    "optional": field.get("null", False) or field.get("blank", False),
-                    "description": field.get("help_text", ""),
-                }
+                FieldInfo(
+                    name=field["name"],
+                    type_hint=mapping_get(field_get("type", "CharField"), "str"),
+                    optional=field_get("null", False) or field_get("blank", False),
+                    description=field_get("help_text", ""),
+                )
             )
 
         return converted_fields
 
-    def _get_create_fields(self, fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """作成用フィールドを取得"""
+    def _field_type_flags(self, fields: List[Dict[str, Any]]) -> Tuple[bool, bool]:
+        """EmailField/URLFieldの使用有無を1回の走査で判定"""
+        has_email = has_url = False
+        for field in fields:
+            field_type = field.get("type")
+            if field_type == "EmailField":
+                has_email = True
+            elif field_type == "URLField":
+                has_url = True
+
+            if has_email and has_url:
+                break
+
+        return has_email, has_url
+
+    # 自動生成カラムはcreate/updateスキーマから除外する
+    _CREATE_EXCLUDED = frozenset({"id", "created_at", "updated_at"})
+    _UPDATE_EXCLUDED = frozenset({"id", "created_at"})
+
+    def _get_create_fields(
+        self, converted_fields: List[FieldInfo]
+    ) -> List[FieldInfo]:
+        """作成用フィールドを取得（変換済みフィールドから絞り込み）"""
         return [
             field
-            for field in self._convert_model_fields(fields)
-            if field["name"] not in ["id", "created_at", "updated_at"]
+            for field in converted_fields
+            if field.name not in self._CREATE_EXCLUDED
         ]
 
-    def _get_update_fields(self, fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """更新用フィールドを取得"""
+    def _get_update_fields(
+        self, converted_fields: List[FieldInfo]
+    ) -> List[FieldInfo]:
+        """更新用フィールドを取得（変換済みフィールドから絞り込み）"""
         return [
             field
-            for field in self._convert_model_fields(fields)
-            if field["name"] not in ["id", "created_at"]
+            for field in converted_fields
+            if field.name not in self._UPDATE_EXCLUDED
         ]
 
-    def _has_email_field(self, fields: List[Dict[str, Any]]) -> bool:
-        """EmailFieldが含まれているかチェック"""
-        return any(field.get("type") == "EmailField" for field in fields)
-
-    def _has_url_field(self, fields: List[Dict[str, Any]]) -> bool:
-        """URLFieldが含まれているかチェック"""
-        return any(field.get("type") == "URLField" for field in fields)
-
-    def _kebab_case(self, text: str) -> str:
-        """kebab-caseに変換"""
-        return text.replace("_", "-").lower()
-
-    def _camel_case(self, text: str) -> str:
-        """camelCaseに変換"""
-        components = text.split("_")
-        return components[0] + "".join(x.title() for x in components[1:])
-
-    def _snake_case(self, text: str) -> str:
-        """snake_caseに変換"""
-        return text.lower().replace("-", "_")
-
-    def _plural(self, text: str) -> str:
-        """複数形に変換"""
-        return self.inflect_engine.plural(text)
-
     def _to_pascal_case(self, text: str) -> str:
         """PascalCaseに変換"""
-        return "".join(word.capitalize() for word in text.split("_"))
+        return _pascal_case(text)
@@ -5,28 +5,80 @@
 import os
 import shutil
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Iterator, Tuple, Union
 
 
 class FileManager:
     """ファイル操作を管理するクラス"""
+
+    # 作成済みディレクトリのキャッシュ（同一ディレクトリへのmkdir/statを省く）
+    _known_dirs: set = set()
+
+    @classmethod
+    def _ensure_dir(cls, dir_path: Path) -> None:
+        """ディレクトリの存在を保証（作成済みならシステムコールなし）"""
+        key = str(dir_path)
+        if key in cls._known_dirs:
+            return
+
+        dir_path.mkdir(parents=True, exist_ok=True)
+        cls._known_dirs.add(key)
     
     @staticmethod
     def write_file(file_path: Union[str, Path], content: str, encoding: str = "utf-8") -> None:
         """ファイルに内容を書き込み"""
-        file_path = Path(file_path)
-        
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+
         # ディレクトリが存在しない場合は作成
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(file_path, 'w', encoding=encoding) as f:
-            f.write(content)
+        FileManager._ensure_dir(file_path.parent)
+
+        file_path.write_text(content, encoding=encoding)
     
+    @staticmethod
+    def write_files_bulk(
+        items: Iterable[Tuple[Union[str, Path], str]], encoding: str = "utf-8"
+    ) -> None:
+        """複数ファイルをまとめて書き込み
+
+        親ディレクトリの作成はユニークなディレクトリごとに1回だけ行い、
+        ファイル単位のmkdir/statの繰り返しを避ける。
+        """
+        items = [(Path(file_path), content) for file_path, content in items]
+
+        for parent in {file_path.parent for file_path, _ in items}:
+            FileManager._ensure_dir(parent)
+
+        for file_path, content in items:
+            file_path.write_text(content, encoding=encoding)
+
+    @staticmethod
+    def write_if_changed(file_path: Union[str, Path], content: str, encoding: str = "utf-8") -> bool:
+        """内容が変化した場合のみファイルに書き込み
+
+        既存ファイルと同一内容なら書き込みをスキップし、ファイルウォッチャーや
+        下流のコード生成の不要な再実行を防ぐ。書き込んだ場合はTrueを返す。
+        """
+        file_path = Path(file_path)
+        encoded = content.encode(encoding)
+
+        if file_path.exists():
+            try:
+                if file_path.read_bytes() == encoded:
+                    return False
+            except OSError:
+                pass
+
+        FileManager.write_file(file_path, content, encoding=encoding)
+        return True
+
     @staticmethod
     def read_file(file_path: Union[str, Path], encoding: str = "utf-8") -> str:
         """ファイルの内容を読み込み"""
-        with open(file_path, 'r', encoding=encoding) as f:
-            return f.read()
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+
+        return file_path.read_text(encoding=encoding)
     
     @staticmethod
     def file_exists(file_path: Union[str, Path]) -> bool:
@@ -36,18 +88,27 @@ class FileManager:
     @staticmethod
     def create_directory(dir_path: Union[str, Path]) -> None:
         """ディレクトリを作成"""
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        FileManager._ensure_dir(Path(dir_path))
     
     @staticmethod
-    def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
-        """ファイルをコピー"""
+    def copy_file(
+        src: Union[str, Path], dst: Union[str, Path], preserve_metadata: bool = False
+    ) -> None:
+        """ファイルをコピー
+
+        生成コードの配置ではメタデータの維持は不要なので、既定では
+        mtime/モードをコピーしないcopyfileを使う。
+        """
         src_path = Path(src)
         dst_path = Path(dst)
-        
+
         # コピー先のディレクトリが存在しない場合は作成
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        shutil.copy2(src_path, dst_path)
+        FileManager._ensure_dir(dst_path.parent)
+
+        if preserve_metadata:
+            shutil.copy2(src_path, dst_path)
+        else:
+            shutil.copyfile(src_path, dst_path)
     
     @staticmethod
     def copy_directory(src: Union[str, Path], dst: Union[str, Path]) -> None:
@@ -67,16 +128,25 @@ class FileManager:
         dir_path = Path(dir_path)
         if dir_path.exists():
             shutil.rmtree(dir_path)
+
+        # 削除したツリー配下の作成済みキャッシュを無効化する
+        prefix = str(dir_path)
+        FileManager._known_dirs = {
+            known
+            for known in FileManager._known_dirs
+            if known != prefix and not known.startswith(prefix + os.sep)
+        }
     
     @staticmethod
     def append_to_file(file_path: Union[str, Path], content: str, encoding: str = "utf-8") -> None:
         """ファイルに内容を追記"""
-        file_path = Path(file_path)
-        
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+
         # ディレクトリが存在しない場合は作成
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(file_path, 'a', encoding=encoding) as f:
+        FileManager._ensure_dir(file_path.parent)
+
+        with open(file_path, 'a', buffering=-1, encoding=encoding) as f:
             f.write(content)
     
     @staticmethod
@@ -90,11 +160,37 @@ class FileManager:
             
         return backup_path
     
+    @staticmethod
+    def find_files_iter(directory: Union[str, Path], pattern: str = "*") -> Iterator[Path]:
+        """ディレクトリ内のファイルを逐次列挙
+
+        大きなツリーでも全件をメモリに載せずストリーム処理できる。
+        """
+        return Path(directory).rglob(pattern)
+
     @staticmethod
     def find_files(directory: Union[str, Path], pattern: str = "*") -> list[Path]:
         """ディレクトリ内のファイルを検索"""
-        directory = Path(directory)
-        return list(directory.rglob(pattern))
+        return list(FileManager.find_files_iter(directory, pattern))
+
+    @staticmethod
+    def find_files_with_stat(
+        directory: Union[str, Path],
+    ) -> Iterator[Tuple[Path, os.stat_result]]:
+        """ディレクトリ内の全ファイルをstat情報付きで列挙
+
+        os.scandirのDirEntryはstat結果をキャッシュしているため、
+        rglob + statの2システムコールが1回で済む。
+        """
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield Path(entry.path), entry.stat(follow_symlinks=False)
     
     @staticmethod
     def get_file_size(file_path: Union[str, Path]) -> int:
@@ -104,14 +200,23 @@ class FileManager:
     @staticmethod
     def is_text_file(file_path: Union[str, Path]) -> bool:
         """テキストファイルかどうかを判定"""
+        sniff_size = 1024
+        with open(file_path, 'rb') as f:
+            chunk = f.read(sniff_size)  # 最初の1KBを読んでみる
+
+        # NULバイトがあればデコードを試すまでもなくバイナリと判定できる
+        if b'\x00' in chunk:
+            return False
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                f.read(1024)  # 最初の1KBを読んでみる
+            chunk.decode('utf-8')
             return True
-        except UnicodeDecodeError:
-            return False
+        except UnicodeDecodeError as e:
+            # 読み込みウィンドウが満杯（=ファイル途中で切った）場合のみ、
+            # 境界でマルチバイト文字が途切れただけのケースをテキストとみなす
+            return len(chunk) == sniff_size and e.start >= sniff_size - 3
     
     @staticmethod
     def ensure_directory_exists(dir_path: Union[str, Path]) -> None:
         """ディレクトリが存在することを保証"""
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+        FileManager._ensure_dir(Path(dir_path))
\ No newline at end of file